@@ -1,44 +1,250 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import json
-import csv
 import os
+import re
 import sys
 import argparse
+import contextlib
+import functools
+import importlib.util
+import itertools
+import queue
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional, Dict, Iterable, Iterator, List
+
 from dotenv import load_dotenv
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+
+try:
+    import orjson as _json_fast
+except ImportError:
+    import json as _json_fast
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+if TYPE_CHECKING:
+    import requests
+    import smtplib
+    from selenium import webdriver
 
 
 load_dotenv()
 
+_AMAZON_DOMAINS = (
+    "amazon.com",
+    "amazon.ca",
+    "amazon.com.mx",
+    "amazon.com.br",
+    "amazon.co.uk",
+    "amazon.de",
+    "amazon.fr",
+    "amazon.it",
+    "amazon.es",
+    "amazon.nl",
+    "amazon.se",
+    "amazon.pl",
+    "amazon.com.be",
+    "amazon.com.tr",
+    "amazon.ae",
+    "amazon.sa",
+    "amazon.eg",
+    "amazon.in",
+    "amazon.co.jp",
+    "amazon.sg",
+    "amazon.com.au",
+)
+
+_AMAZON_HOSTS = frozenset(
+    f"{prefix}{domain}" for domain in _AMAZON_DOMAINS for prefix in ("", "www.", "smile.")
+)
+_AMAZON_HOST_RE = re.compile(r'(?:^|\.)amazon\.(?:co\.|com\.)?[a-z]{2,3}$')
+
+_NAME_SELECTORS = (
+    "span#productTitle",
+    "h1.a-size-large",
+    "#title span",
+    "h1 span",
+)
+
+_NAME_SELECTOR_GROUP = ", ".join(_NAME_SELECTORS)
+
+_PRICE_SELECTORS = (
+    "span.a-price-whole",
+    "span.a-offscreen",
+    "#priceblock_ourprice",
+    "#priceblock_dealprice",
+    ".a-price .a-offscreen",
+    "span[data-a-color='price'] span.a-offscreen",
+    ".a-price span",
+)
+
+_WHOLE_ONLY_PRICE_SELECTORS = frozenset({"span.a-price-whole"})
+
+_AVAILABILITY_SELECTORS = (
+    "#availability span",
+    "#availability",
+    "#stockAvailability",
+    "div#availability",
+)
+
+_PRICE_RE = re.compile(r'(\d+\.?\d*)')
+_PRICE_CLEAN_TABLE = str.maketrans('', '', '$,')
+
+_CSV_COLS = ('timestamp', 'product_name', 'price', 'availability', 'url')
+_CSV_HEADER = ",".join(_CSV_COLS) + "\r\n"
+_CSV_QUOTE_RE = re.compile(r'[",\r\n]')
+
+_RESULT_FORMATS = ("csv", "jsonl", "parquet")
+_PARQUET_BATCH_ROWS = 500
+_SAVE_BATCH_ROWS = 25
+_RESULTS_BUFFER_SIZE = 1 << 20
+
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_EXTRACT_JS = """
+const [nameSelectors, priceSelectors, availabilitySelectors] = arguments;
+const textOf = (selector) => {
+    const element = document.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+return {
+    name: nameSelectors.map(textOf).find((text) => text) || null,
+    prices: priceSelectors.map(textOf),
+    priceFraction: textOf("span.a-price-fraction"),
+    availability: availabilitySelectors.map(textOf)
+};
+"""
+
+
+def _parse_price(price_text: str) -> Optional[float]:
+    price_match = _PRICE_RE.search(price_text.translate(_PRICE_CLEAN_TABLE))
+    if not price_match:
+        return None
+    
+    price_value = float(price_match.group(1))
+    if price_value > 0 and price_value < 1000000:
+        return price_value
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _parquet_schema():
+    import pyarrow as pa
+    
+    return pa.schema([
+        ('timestamp', pa.string()),
+        ('product_name', pa.string()),
+        ('price', pa.float64()),
+        ('availability', pa.string()),
+        ('url', pa.string()),
+        ('date', pa.string())
+    ])
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config(config_path: str, mtime_ns: int, size: int) -> Dict:
+    return _json_fast.loads(Path(config_path).read_bytes())
+
+
+def _csv_field(value: object) -> str:
+    value = '' if value is None else str(value)
+    if _CSV_QUOTE_RE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _format_price(price: Optional[float]) -> str:
+    return 'N/A' if price is None else f"{price:.2f}"
+
+
+def _copy_config(config: Dict) -> Dict:
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in config.items()}
+
+
+def _url_host(url: str) -> str:
+    return urlparse(url).hostname or ""
+
+
+def _iter_urls(products_file: str) -> Iterator[str]:
+    seen = set()
+    with open(products_file, 'r') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#') and url not in seen:
+                seen.add(url)
+                yield url
+
 
 class PriceTracker:
-    def __init__(self, config_path: str = "config.json", headless: bool = False):
-        self.config = self._load_config(config_path)
+    _driver_path: Optional[str] = None
+    _driver_path_lock = threading.Lock()
+    
+    def __init__(self, config_path: str = "config.json", headless: bool = False,
+                 results_format: Optional[str] = None, config: Optional[Dict] = None):
+        if config is not None:
+            self.config_path = None
+            self.config = _copy_config(config)
+        else:
+            self.config_path = config_path
+            self.config = self._load_config(config_path)
         self.headless = headless
         self.results_file = "results.csv"
-        self.screenshots_dir = Path("screenshots")
-        self.screenshots_dir.mkdir(exist_ok=True)
+        self.parquet_dir = "results_parquet"
+        self.results_format = results_format or self.config.get("results_format", "csv")
+        if self.results_format not in _RESULT_FORMATS:
+            print(f"Unknown results format '{self.results_format}'. Using csv.")
+            self.results_format = "csv"
+        if self.results_format == "parquet":
+            if importlib.util.find_spec("pyarrow") is None:
+                print("Parquet output requires pyarrow (pip install pyarrow). Using csv.")
+                self.results_format = "csv"
+        self.screenshots_dir = Path(self.config.get("screenshots_dir", "screenshots"))
+        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._driver_pool: queue.SimpleQueue[webdriver.Chrome] = queue.SimpleQueue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._results_lock = threading.Lock()
+        self._results_fh = None
+        self._jsonl_fh = None
+        self._parquet_rows: List[Dict] = []
+        self._batch_timestamp: Optional[str] = None
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._extractors = {host: self._scrape_amazon for host in _AMAZON_HOSTS}
         self._initialize_csv()
     
+    def __enter__(self) -> PriceTracker:
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _load_config(self, config_path: str) -> Dict:
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            config_stat = os.stat(config_path)
+            config = _read_config(config_path, config_stat.st_mtime_ns, config_stat.st_size)
+            return _copy_config(config)
         except FileNotFoundError:
             print(f"Config file {config_path} not found. Using defaults.")
             return {
@@ -49,12 +255,16 @@ class PriceTracker:
             }
     
     def _initialize_csv(self):
-        if not os.path.exists(self.results_file):
-            with open(self.results_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['timestamp', 'product_name', 'price', 'availability', 'url'])
+        with open(self.results_file, 'a', newline='', encoding='utf-8') as f:
+            if f.tell() == 0:
+                f.write(_CSV_HEADER)
     
     def _setup_driver(self) -> webdriver.Chrome:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+        
         chrome_options = Options()
         
         if self.headless:
@@ -67,111 +277,172 @@ class PriceTracker:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        service = Service(ChromeDriverManager().install())
+        if self.config.get("fast_mode", False):
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2
+            })
+            chrome_options.page_load_strategy = 'eager'
+        
+        with PriceTracker._driver_path_lock:
+            if PriceTracker._driver_path is None:
+                PriceTracker._driver_path = ChromeDriverManager().install()
+        
+        service = Service(PriceTracker._driver_path)
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.implicitly_wait(self.config.get("implicit_wait_timeout", 10))
+        driver.implicitly_wait(0)
         
         return driver
     
+    def _checkout_driver(self) -> webdriver.Chrome:
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+        driver = self._setup_driver()
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+    
+    def _checkin_driver(self, driver: webdriver.Chrome):
+        self._driver_pool.put(driver)
+    
+    def _discard_driver(self, driver: webdriver.Chrome):
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Failed to quit browser: {str(e)}")
+    
+    def _quit_drivers(self):
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+            self._driver_pool = queue.SimpleQueue()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Failed to quit browser: {str(e)}")
+    
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+            
+            session = requests.Session()
+            session.headers.update(_HTTP_HEADERS)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def _close_sessions(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+    
+    def _parse_page_data(self, url: str, page_data: Dict) -> Dict:
+        price = None
+        availability = "Unknown"
+        
+        fraction_text = page_data.get('priceFraction')
+        for selector, price_text in zip(_PRICE_SELECTORS, page_data.get('prices') or []):
+            if price_text is None:
+                continue
+            
+            if selector in _WHOLE_ONLY_PRICE_SELECTORS and fraction_text is not None:
+                whole_text = price_text.rstrip('. \n')
+                price_text = f"{whole_text}.{fraction_text}"
+            
+            price = _parse_price(price_text)
+            if price is not None:
+                break
+        
+        for availability_text in page_data.get('availability') or []:
+            if availability_text is None:
+                continue
+            
+            availability_text = availability_text.lower()
+            if 'in stock' in availability_text or 'available' in availability_text:
+                availability = "In Stock"
+                break
+            elif 'out of stock' in availability_text or 'unavailable' in availability_text:
+                availability = "Out of Stock"
+                break
+        
+        if availability == "Unknown" and price:
+            availability = "In Stock"
+        
+        return {
+            'product_name': page_data['name'],
+            'price': price,
+            'availability': availability,
+            'url': url
+        }
+    
+    def _extract_amazon_product_http(self, url: str) -> Optional[Dict]:
+        if HTMLParser is None:
+            return None
+        
+        import requests
+        
+        try:
+            response = self._get_session().get(url, timeout=self.config.get("explicit_wait_timeout", 20))
+            response.raise_for_status()
+        except requests.RequestException:
+            return None
+        
+        tree = HTMLParser(response.text)
+        if tree.css_first("span#productTitle") is None:
+            return None
+        
+        def text_of(selector: str) -> Optional[str]:
+            node = tree.css_first(selector)
+            return node.text().strip() if node is not None else None
+        
+        page_data = {
+            'name': next((text for text in map(text_of, _NAME_SELECTORS) if text), None),
+            'prices': [text_of(selector) for selector in _PRICE_SELECTORS],
+            'priceFraction': text_of("span.a-price-fraction"),
+            'availability': [text_of(selector) for selector in _AVAILABILITY_SELECTORS]
+        }
+        if not page_data['name']:
+            return None
+        
+        product_data = self._parse_page_data(url, page_data)
+        if product_data['price'] is None:
+            return None
+        
+        return product_data
+    
     def _extract_amazon_product(self, driver: webdriver.Chrome, url: str) -> Optional[Dict]:
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         wait_timeout = self.config.get("explicit_wait_timeout", 20)
         wait = WebDriverWait(driver, wait_timeout)
         
         try:
-            product_name = None
-            price = None
-            availability = "Unknown"
-            
-            name_selectors = [
-                "span#productTitle",
-                "h1.a-size-large",
-                "#title span",
-                "h1 span"
-            ]
+            try:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _NAME_SELECTOR_GROUP)))
+            except TimeoutException:
+                pass
             
-            for selector in name_selectors:
-                try:
-                    name_element = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    product_name = name_element.text.strip()
-                    break
-                except TimeoutException:
-                    continue
+            page_data = driver.execute_script(
+                _EXTRACT_JS, _NAME_SELECTORS, _PRICE_SELECTORS, _AVAILABILITY_SELECTORS
+            )
             
-            if not product_name:
+            if not page_data.get('name'):
                 print(f"Warning: Could not extract product name from {url}")
                 return None
             
-            price_selectors = [
-                "span.a-price-whole",
-                "span.a-offscreen",
-                "#priceblock_ourprice",
-                "#priceblock_dealprice",
-                ".a-price .a-offscreen",
-                "span[data-a-color='price'] span.a-offscreen",
-                ".a-price span"
-            ]
-            
-            for selector in price_selectors:
-                try:
-                    price_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if price_elements:
-                        price_text = price_elements[0].text.strip()
-                        
-                        try:
-                            price_fraction = driver.find_element(By.CSS_SELECTOR, "span.a-price-fraction")
-                            if price_fraction:
-                                fraction_text = price_fraction.text.strip()
-                                price_text = f"{price_text}.{fraction_text}"
-                        except NoSuchElementException:
-                            pass
-                        
-                        price_text = price_text.replace('$', '').replace(',', '').strip()
-                        if price_text:
-                            try:
-                                import re
-                                price_match = re.search(r'(\d+\.?\d*)', price_text)
-                                if price_match:
-                                    price_value = float(price_match.group(1))
-                                    if price_value > 0 and price_value < 1000000:
-                                        price = price_value
-                                        break
-                            except (ValueError, AttributeError):
-                                continue
-                except (NoSuchElementException, IndexError):
-                    continue
-            
-            availability_selectors = [
-                "#availability span",
-                "#availability",
-                "#stockAvailability",
-                "div#availability"
-            ]
-            
-            for selector in availability_selectors:
-                try:
-                    avail_element = driver.find_element(By.CSS_SELECTOR, selector)
-                    availability_text = avail_element.text.strip().lower()
-                    
-                    if 'in stock' in availability_text or 'available' in availability_text:
-                        availability = "In Stock"
-                        break
-                    elif 'out of stock' in availability_text or 'unavailable' in availability_text:
-                        availability = "Out of Stock"
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if availability == "Unknown" and price:
-                availability = "In Stock"
-            
-            return {
-                'product_name': product_name,
-                'price': price,
-                'availability': availability,
-                'url': url
-            }
+            return self._parse_page_data(url, page_data)
             
         except Exception as e:
             print(f"Error extracting data from {url}: {str(e)}")
@@ -191,44 +462,150 @@ class PriceTracker:
             print(f"Failed to take screenshot: {str(e)}")
     
     def _save_result(self, product_data: Dict):
-        if not product_data:
+        if product_data:
+            self._save_results([product_data])
+    
+    def _save_results(self, products: List[Dict]):
+        if not products:
             return
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._batch_timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        price_value = product_data.get('price')
-        if price_value is None:
-            price_str = 'N/A'
-        else:
-            price_str = f"{float(price_value):.2f}"
+        prices = [
+            None if product_data.get('price') is None else float(product_data['price'])
+            for product_data in products
+        ]
         
-        with open(self.results_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
+        rows = [
+            (
                 timestamp,
                 product_data.get('product_name', 'N/A'),
-                price_str,
+                _format_price(price),
                 product_data.get('availability', 'N/A'),
                 product_data.get('url', 'N/A')
-            ])
+            )
+            for product_data, price in zip(products, prices)
+        ]
+        
+        csv_data = "".join(
+            f"{timestamp},{_csv_field(name)},{price},{_csv_field(availability)},{_csv_field(url)}\r\n"
+            for timestamp, name, price, availability, url in rows
+        ).encode('utf-8')
+        
+        records = []
+        if self.results_format != "csv":
+            records = [
+                dict(
+                    zip(_CSV_COLS, row),
+                    price=price,
+                    date=timestamp[:10]
+                )
+                for row, price in zip(rows, prices)
+            ]
+        
+        with self._results_lock:
+            if self._results_fh is None:
+                self._results_fh = open(self.results_file, 'ab', buffering=_RESULTS_BUFFER_SIZE)
+            
+            self._results_fh.write(csv_data)
+            self._results_fh.flush()
+            
+            if self.results_format == "jsonl":
+                if self._jsonl_fh is None:
+                    self._jsonl_fh = open(Path(self.results_file).with_suffix('.jsonl'), 'a', buffering=_RESULTS_BUFFER_SIZE, encoding='utf-8')
+                self._jsonl_fh.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+                self._jsonl_fh.flush()
+            elif self.results_format == "parquet":
+                self._parquet_rows.extend(records)
+                if len(self._parquet_rows) >= _PARQUET_BATCH_ROWS:
+                    self._flush_parquet()
     
-    def _check_price_threshold(self, product_data: Dict):
-        price = product_data.get('price')
-        if price is None:
+    def _flush_parquet(self):
+        if not self._parquet_rows:
             return
         
-        threshold = self.config.get("price_threshold", float('inf'))
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        table = pa.Table.from_pylist(self._parquet_rows, schema=_parquet_schema())
+        pq.write_to_dataset(table, root_path=self.parquet_dir, partition_cols=['date'])
+        self._parquet_rows = []
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        
+        self._quit_drivers()
+        self._close_sessions()
+        self._close_smtp()
         
-        if price < threshold:
-            product_name = product_data.get('product_name', 'Product')
-            print(f"\n🚨 ALERT: {product_name} is below threshold!")
-            print(f"   Current Price: ${price:.2f}")
-            print(f"   Threshold: ${threshold:.2f}")
+        with self._results_lock:
+            if self._results_fh is not None:
+                self._results_fh.close()
+                self._results_fh = None
             
-            if self.config.get("email_alerts", {}).get("enabled", False):
-                self._send_email_alert(product_data, price, threshold)
+            if self._jsonl_fh is not None:
+                self._jsonl_fh.close()
+                self._jsonl_fh = None
+            
+            self._flush_parquet()
+    
+    def _check_price_threshold(self, product_data: Dict):
+        self._check_price_thresholds([product_data])
+    
+    def _check_price_thresholds(self, products: List[Dict]):
+        threshold = self.config.get("price_threshold", float('inf'))
+        
+        alerts = [
+            product_data for product_data in products
+            if product_data.get('price') is not None and product_data['price'] < threshold
+        ]
+        if not alerts:
+            return
+        
+        print("\n".join(
+            f"\n🚨 ALERT: {product_data.get('product_name', 'Product')} is below threshold!\n"
+            f"   Current Price: ${product_data['price']:.2f}\n"
+            f"   Threshold: ${threshold:.2f}"
+            for product_data in alerts
+        ))
+        
+        if self.config.get("email_alerts", {}).get("enabled", False):
+            for product_data in alerts:
+                self._send_email_alert(product_data, product_data['price'], threshold)
+    
+    def _get_smtp(self, smtp_server: str, smtp_port: int, sender_email: str, password: str) -> smtplib.SMTP:
+        import smtplib
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+        
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        server.starttls()
+        server.login(sender_email, password)
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        import smtplib
+        
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPServerDisconnected:
+                    pass
+                self._smtp = None
     
     def _send_email_alert(self, product_data: Dict, price: float, threshold: float):
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        
         email_config = self.config.get("email_alerts", {})
         
         sender_email = os.getenv("EMAIL_SENDER") or email_config.get("sender_email", "")
@@ -262,66 +639,112 @@ class PriceTracker:
             
             msg.attach(MIMEText(body, 'plain'))
             
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(sender_email, password)
-            server.send_message(msg)
-            server.quit()
+            with self._smtp_lock:
+                server = self._get_smtp(smtp_server, smtp_port, sender_email, password)
+                server.send_message(msg)
             
             print("   ✓ Email alert sent successfully!")
             
         except Exception as e:
             print(f"   ✗ Failed to send email alert: {str(e)}")
     
+    def _scrape_amazon(self, url: str) -> Optional[Dict]:
+        if self.config.get("http_first", True):
+            product_data = self._extract_amazon_product_http(url)
+            if product_data is not None:
+                return product_data
+        
+        from selenium.common.exceptions import WebDriverException
+        
+        driver = self._checkout_driver()
+        try:
+            driver.get(url)
+        except Exception as e:
+            if self.config.get("screenshot_on_error", True):
+                self._take_screenshot(driver, url)
+            if isinstance(e, WebDriverException):
+                self._discard_driver(driver)
+            else:
+                self._checkin_driver(driver)
+            raise
+        
+        try:
+            return self._extract_amazon_product(driver, url)
+        finally:
+            self._checkin_driver(driver)
+    
+    def _scrape_one(self, url: str, idx: int) -> Optional[Dict]:
+        header = f"\n[{idx}] Tracking: {url}"
+        
+        host = _url_host(url)
+        extractor = self._extractors.get(host)
+        if extractor is None and _AMAZON_HOST_RE.search(host):
+            extractor = self._extractors[host] = self._scrape_amazon
+        if extractor is None:
+            print(f"{header}\nUnsupported domain for URL: {url}\nCurrently only Amazon URLs are supported.")
+            return None
+        
+        try:
+            product_data = extractor(url)
+            
+            if product_data:
+                print(f"{header}\n{_format_product(product_data)}")
+            else:
+                print(f"{header}\n  ✗ Failed to extract product data")
+            
+            return product_data
+        
+        except Exception as e:
+            print(f"{header}\n  ✗ Error processing {url}: {str(e)}")
+            return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            workers = max(1, self.config.get("parallel_workers", 4))
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dealhound")
+        return self._executor
+    
+    def begin_batch(self):
+        self._batch_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def end_batch(self):
+        self._batch_timestamp = None
+    
+    def track_urls(self, urls: Iterable[str]) -> List[Optional[Dict]]:
+        results = []
+        pending = []
+        
+        self.begin_batch()
+        try:
+            for product_data in self._get_executor().map(self._scrape_one, urls, itertools.count(1)):
+                results.append(product_data)
+                if product_data:
+                    pending.append(product_data)
+                    if len(pending) >= _SAVE_BATCH_ROWS:
+                        self._save_results(pending)
+                        pending = []
+        finally:
+            self._save_results(pending)
+            self.end_batch()
+        
+        self._check_price_thresholds([product_data for product_data in results if product_data])
+        
+        return results
+    
     def track_products(self, products_file: str = "products.txt"):
         if not os.path.exists(products_file):
             print(f"Error: Products file '{products_file}' not found.")
             return
         
-        with open(products_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
-        if not urls:
-            print("No valid URLs found in products file.")
-            return
-        
-        print(f"Starting DealHound tracker for {len(urls)} product(s)...")
+        print("Starting DealHound tracker...")
         print("-" * 60)
         
-        driver = None
         try:
-            driver = self._setup_driver()
+            results = self.track_urls(_iter_urls(products_file))
             
-            for idx, url in enumerate(urls, 1):
-                print(f"\n[{idx}/{len(urls)}] Tracking: {url}")
-                
-                try:
-                    driver.get(url)
-                    
-                    import time
-                    time.sleep(2)
-                    
-                    if "amazon" in url.lower():
-                        product_data = self._extract_amazon_product(driver, url)
-                    else:
-                        print(f"Unsupported domain for URL: {url}")
-                        print("Currently only Amazon URLs are supported.")
-                        continue
-                    
-                    if product_data:
-                        print(f"  ✓ Product: {product_data['product_name'][:60]}...")
-                        print(f"  ✓ Price: ${product_data['price']:.2f}" if product_data.get('price') else "  ✓ Price: N/A")
-                        print(f"  ✓ Availability: {product_data['availability']}")
-                        
-                        self._save_result(product_data)
-                        self._check_price_threshold(product_data)
-                    else:
-                        print("  ✗ Failed to extract product data")
-                
-                except Exception as e:
-                    print(f"  ✗ Error processing {url}: {str(e)}")
-                    if self.config.get("screenshot_on_error", True) and driver:
-                        self._take_screenshot(driver, url)
+            if not results:
+                print("No valid URLs found in products file.")
+                return
             
             print("\n" + "-" * 60)
             print(f"Tracking complete! Results saved to {self.results_file}")
@@ -330,8 +753,115 @@ class PriceTracker:
             print(f"Fatal error: {str(e)}")
             sys.exit(1)
         finally:
-            if driver:
-                driver.quit()
+            self.close()
+
+
+_DAEMON_SUPPORTED = hasattr(socket, "AF_UNIX")
+_DAEMON_RELOADABLE_KEYS = (
+    "price_threshold",
+    "email_alerts",
+    "screenshot_on_error",
+    "explicit_wait_timeout",
+    "http_first"
+)
+
+
+if _DAEMON_SUPPORTED:
+    class _DaemonServer(socketserver.UnixStreamServer):
+        def __init__(self, socket_path: str, tracker: PriceTracker, idle_timeout: float):
+            self.tracker = tracker
+            self.timeout = idle_timeout * 60 if idle_timeout > 0 else None
+            self.idle = False
+            super().__init__(socket_path, _DaemonRequestHandler)
+        
+        def handle_timeout(self):
+            self.idle = True
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        tracker = self.server.tracker
+        try:
+            request = _json_fast.loads(self.rfile.readline())
+            if tracker.config_path is not None:
+                config = tracker._load_config(tracker.config_path)
+                tracker.config.update((key, config[key]) for key in _DAEMON_RELOADABLE_KEYS if key in config)
+            results = tracker.track_urls(request.get("urls", []))
+            response = {"results": [result for result in results if result]}
+        except Exception as e:
+            print(f"Failed to handle daemon request: {str(e)}")
+            response = {"error": str(e)}
+        
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+
+def _format_product(product_data: Dict) -> str:
+    price_line = f"  ✓ Price: ${product_data['price']:.2f}" if product_data.get('price') else "  ✓ Price: N/A"
+    return "\n".join([
+        f"  ✓ Product: {product_data['product_name'][:60]}...",
+        price_line,
+        f"  ✓ Availability: {product_data['availability']}"
+    ])
+
+
+def _remove_stale_socket(socket_path: str):
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    
+    if not stat.S_ISSOCK(mode):
+        print(f"Error: {socket_path} exists and is not a socket. Choose another path with --socket.")
+        sys.exit(1)
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+        except FileNotFoundError:
+            return
+    
+    print(f"Error: A DealHound daemon is already listening on {socket_path}.")
+    sys.exit(1)
+
+
+def run_daemon(tracker: PriceTracker, socket_path: str, idle_timeout: float):
+    _remove_stale_socket(socket_path)
+    
+    server = _DaemonServer(socket_path, tracker, idle_timeout)
+    print(f"DealHound daemon listening on {socket_path}")
+    
+    try:
+        while not server.idle:
+            server.handle_request()
+        print(f"No requests for {idle_timeout:g} minute(s). Shutting down.")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+        tracker.close()
+
+
+def send_to_daemon(socket_path: str, urls: List[str]) -> List[Dict]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps({"urls": urls}).encode('utf-8') + b"\n")
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    
+    if not line:
+        raise ConnectionError("daemon closed the connection without replying")
+    
+    response = _json_fast.loads(line)
+    
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    
+    return response["results"]
 
 
 def main():
@@ -356,11 +886,61 @@ def main():
         default='config.json',
         help='Path to config file (default: config.json)'
     )
+    parser.add_argument(
+        '--format',
+        choices=_RESULT_FORMATS,
+        default=None,
+        help='Also write results as JSON Lines or a date-partitioned Parquet dataset (default: csv only)'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Keep the browser running and serve tracking requests over a Unix socket'
+    )
+    parser.add_argument(
+        '--urls',
+        nargs='+',
+        metavar='URL',
+        help='Send URLs to a running daemon and print the results'
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        default=os.path.join(tempfile.gettempdir(), 'dealhound.sock'),
+        help='Path to the daemon socket (default: dealhound.sock in the temp directory)'
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=30,
+        help='Minutes without requests before the daemon exits, 0 to never exit (default: 30)'
+    )
     
     args = parser.parse_args()
     
-    tracker = PriceTracker(config_path=args.config, headless=args.headless)
-    tracker.track_products(products_file=args.products)
+    if (args.daemon or args.urls) and not _DAEMON_SUPPORTED:
+        print("Error: Daemon mode needs Unix domain sockets and is not supported on this platform.")
+        sys.exit(1)
+    
+    if args.urls:
+        try:
+            results = send_to_daemon(args.socket, args.urls)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print(f"Error: No DealHound daemon listening on {args.socket}. Start one with --daemon.")
+            sys.exit(1)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Error: Daemon request failed: {str(e)}")
+            sys.exit(1)
+        
+        for product_data in results:
+            print(f"\n{product_data['url']}\n{_format_product(product_data)}")
+        return
+    
+    with PriceTracker(config_path=args.config, headless=args.headless, results_format=args.format) as tracker:
+        if args.daemon:
+            run_daemon(tracker, args.socket, args.idle_timeout)
+        else:
+            tracker.track_products(products_file=args.products)
 
 
 if __name__ == "__main__":
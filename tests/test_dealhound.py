@@ -3,16 +3,16 @@ import pytest
 import json
 import csv
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from dealhound import PriceTracker
+from types import SimpleNamespace
+from unittest.mock import patch
+from dealhound import PriceTracker, _AMAZON_HOSTS, _DAEMON_SUPPORTED, _iter_urls, _parse_price, _remove_stale_socket, _url_host
 
 
 class TestPriceTracker:
     @pytest.fixture
     def temp_config(self):
-        config = {
+        return {
             "price_threshold": 100.0,
             "email_alerts": {
                 "enabled": False
@@ -21,24 +21,38 @@ class TestPriceTracker:
             "explicit_wait_timeout": 20,
             "implicit_wait_timeout": 10
         }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config, f)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        os.unlink(temp_path)
     
     @pytest.fixture
-    def tracker(self, temp_config):
-        return PriceTracker(config_path=temp_config, headless=True)
+    def temp_config_file(self, tmp_path, temp_config):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(temp_config))
+        return str(config_file)
+    
+    @pytest.fixture
+    def tracker(self, temp_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with PriceTracker(config=temp_config, headless=True) as tracker:
+            yield tracker
     
-    def test_config_loading(self, temp_config):
-        tracker = PriceTracker(config_path=temp_config)
+    def test_config_loading(self, temp_config_file):
+        tracker = PriceTracker(config_path=temp_config_file)
         assert tracker.config["price_threshold"] == 100.0
         assert tracker.config["screenshot_on_error"] is True
     
+    def test_config_dict(self, temp_config):
+        tracker = PriceTracker(config=temp_config)
+        assert tracker.config == temp_config
+        
+        tracker.config["email_alerts"]["enabled"] = True
+        assert temp_config["email_alerts"]["enabled"] is False
+    
+    def test_config_cache_returns_independent_copies(self, temp_config_file):
+        first = PriceTracker(config_path=temp_config_file)
+        first.config["email_alerts"]["enabled"] = True
+        
+        second = PriceTracker(config_path=temp_config_file)
+        assert second.config["email_alerts"]["enabled"] is False
+    
     def test_config_missing_file(self):
         tracker = PriceTracker(config_path="nonexistent_config.json")
         assert "price_threshold" in tracker.config
@@ -58,6 +72,15 @@ class TestPriceTracker:
             expected_headers = ['timestamp', 'product_name', 'price', 'availability', 'url']
             assert headers == expected_headers
     
+    def test_csv_initialization_empty_file(self, tracker):
+        open(tracker.results_file, 'w').close()
+        
+        tracker._initialize_csv()
+        
+        with open(tracker.results_file, 'r') as f:
+            headers = next(csv.reader(f))
+            assert headers == ['timestamp', 'product_name', 'price', 'availability', 'url']
+    
     def test_save_result(self, tracker):
         if os.path.exists(tracker.results_file):
             os.remove(tracker.results_file)
@@ -83,6 +106,77 @@ class TestPriceTracker:
             assert rows[0]['price'] == '49.99'
             assert rows[0]['availability'] == 'In Stock'
     
+    def test_save_result_quotes_special_characters(self, tracker):
+        if os.path.exists(tracker.results_file):
+            os.remove(tracker.results_file)
+        
+        tracker._initialize_csv()
+        
+        test_data = {
+            'product_name': 'Widget, 12" "Deluxe"\nEdition',
+            'price': 1234.5,
+            'availability': 'In Stock',
+            'url': 'https://example.com/product?a=1,2'
+        }
+        
+        tracker._save_result(test_data)
+        
+        with open(tracker.results_file, 'r', newline='') as f:
+            rows = list(csv.DictReader(f))
+            assert len(rows) == 1
+            assert rows[0]['product_name'] == test_data['product_name']
+            assert rows[0]['price'] == '1234.50'
+            assert rows[0]['url'] == test_data['url']
+        
+        tracker._save_result({'product_name': None, 'price': None, 'availability': None, 'url': 'https://example.com'})
+        
+        with open(tracker.results_file, 'r', newline='') as f:
+            rows = list(csv.DictReader(f))
+            assert rows[1]['product_name'] == ''
+            assert rows[1]['availability'] == ''
+    
+    def test_batch_timestamp_shared_across_rows(self, tracker):
+        if os.path.exists(tracker.results_file):
+            os.remove(tracker.results_file)
+        
+        tracker._initialize_csv()
+        
+        batch_timestamps = []
+        
+        def scrape_one(url, idx):
+            batch_timestamps.append(tracker._batch_timestamp)
+            return {'product_name': f'Product {idx}', 'price': 150.0, 'availability': 'In Stock', 'url': url}
+        
+        with patch.object(tracker, '_scrape_one', side_effect=scrape_one):
+            tracker.track_urls(["https://www.amazon.com/dp/TEST123", "https://www.amazon.com/dp/TEST456"])
+        
+        with open(tracker.results_file, 'r', newline='') as f:
+            rows = list(csv.DictReader(f))
+            assert len(rows) == 2
+            assert batch_timestamps[0] is not None
+            assert [row['timestamp'] for row in rows] == batch_timestamps
+        assert tracker._batch_timestamp is None
+    
+    def test_track_urls_saves_completed_rows_when_interrupted(self, tracker):
+        if os.path.exists(tracker.results_file):
+            os.remove(tracker.results_file)
+        
+        tracker._initialize_csv()
+        
+        def scrape_one(url, idx):
+            if idx == 4:
+                raise KeyboardInterrupt
+            return {'product_name': f'Product {idx}', 'price': 150.0, 'availability': 'In Stock', 'url': url}
+        
+        urls = [f"https://www.amazon.com/dp/TEST{idx}" for idx in range(1, 6)]
+        with patch('dealhound._SAVE_BATCH_ROWS', 2), patch.object(tracker, '_scrape_one', side_effect=scrape_one):
+            with pytest.raises(KeyboardInterrupt):
+                tracker.track_urls(urls)
+        
+        with open(tracker.results_file, 'r', newline='') as f:
+            rows = list(csv.DictReader(f))
+            assert [row['url'] for row in rows] == urls[:3]
+    
     def test_save_result_with_none_price(self, tracker):
         if os.path.exists(tracker.results_file):
             os.remove(tracker.results_file)
@@ -132,6 +226,17 @@ class TestPriceTracker:
         assert tracker.screenshots_dir.exists()
         assert tracker.screenshots_dir.is_dir()
     
+    def test_scrape_dispatches_any_amazon_storefront(self, tracker):
+        with patch.object(tracker, '_scrape_amazon', return_value=None) as mock_scrape:
+            tracker._scrape_one("https://m.amazon.com/dp/TEST123", 1)
+            tracker._scrape_one("https://www.amazon.co.za/dp/TEST123", 2)
+            tracker._scrape_one("https://amazon.example.com/dp/TEST123", 3)
+        
+        assert [call.args[0] for call in mock_scrape.call_args_list] == [
+            "https://m.amazon.com/dp/TEST123",
+            "https://www.amazon.co.za/dp/TEST123"
+        ]
+    
     @patch('selenium.webdriver.Chrome')
     def test_driver_setup_headless(self, mock_chrome):
         tracker = PriceTracker(headless=True)
@@ -139,35 +244,61 @@ class TestPriceTracker:
         mock_chrome.assert_called_once()
     
     def test_extract_amazon_product_mock(self, tracker):
-        mock_driver = MagicMock()
-        mock_wait = MagicMock()
-        
-        with patch('dealhound.WebDriverWait', return_value=mock_wait):
-            mock_name_element = MagicMock()
-            mock_name_element.text = "Test Product Name"
-            mock_wait.until.return_value = mock_name_element
-            
-            mock_price_element = MagicMock()
-            mock_price_element.text = "$49.99"
-            mock_driver.find_elements.return_value = [mock_price_element]
-            
+        page_data = {
+            'name': 'Test Product Name',
+            'prices': [None, '$49.99', None, None, None, None, None],
+            'priceFraction': None,
+            'availability': ['In Stock', None, None, None]
+        }
+        mock_driver = SimpleNamespace(execute_script=lambda *args: page_data)
+        mock_wait = SimpleNamespace(until=lambda *args: None)
+        
+        with patch('selenium.webdriver.support.ui.WebDriverWait', return_value=mock_wait):
             url = "https://www.amazon.com/dp/TEST123"
             result = tracker._extract_amazon_product(mock_driver, url)
-            assert result is None or isinstance(result, dict)
+        
+        assert result == {
+            'product_name': 'Test Product Name',
+            'price': 49.99,
+            'availability': 'In Stock',
+            'url': url
+        }
+    
+    def test_failed_driver_is_not_reused(self, tracker):
+        from selenium.common.exceptions import WebDriverException
+        
+        def fail_get(url):
+            raise WebDriverException("invalid session id")
+        
+        quit_calls = []
+        dead_driver = SimpleNamespace(get=fail_get, quit=lambda: quit_calls.append(True))
+        healthy_driver = SimpleNamespace(get=lambda url: None, quit=lambda: None)
+        tracker.config.update(http_first=False, screenshot_on_error=False)
+        
+        with patch.object(tracker, '_setup_driver', side_effect=[dead_driver, healthy_driver]), \
+                patch.object(tracker, '_extract_amazon_product', side_effect=lambda driver, url: driver):
+            with pytest.raises(WebDriverException):
+                tracker._scrape_amazon("https://www.amazon.com/dp/TEST123")
+            assert tracker._scrape_amazon("https://www.amazon.com/dp/TEST123") is healthy_driver
+        
+        assert quit_calls == [True]
+        assert tracker._drivers == [healthy_driver]
 
 
 class TestDataValidation:
     def test_price_numeric_validation(self):
         test_prices = ["$49.99", "$1,234.56", "49.99", "100"]
         
-        import re
         for price_text in test_prices:
-            cleaned = price_text.replace('$', '').replace(',', '').strip()
-            match = re.search(r'(\d+\.?\d*)', cleaned)
-            if match:
-                price = float(match.group(1))
-                assert isinstance(price, float)
-                assert price > 0
+            price = _parse_price(price_text)
+            assert isinstance(price, float)
+            assert price > 0
+    
+    def test_price_parsing_values(self):
+        assert _parse_price("$1,234.56") == 1234.56
+        assert _parse_price("1,299.99") == 1299.99
+        assert _parse_price("Currently unavailable") is None
+        assert _parse_price("$0.00") is None
     
     def test_csv_column_types(self):
         timestamp = "2024-01-15 10:30:00"
@@ -191,8 +322,34 @@ def sample_products_file(tmp_path):
 def test_products_file_loading(sample_products_file):
     tracker = PriceTracker()
     
-    with open(sample_products_file, 'r') as f:
-        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    urls = list(_iter_urls(sample_products_file))
     
     assert len(urls) == 1
-    assert "amazon.com" in urls[0]
+    assert _url_host(urls[0]) in _AMAZON_HOSTS
+
+
+def test_products_file_skips_comments_and_duplicates(tmp_path):
+    products_file = tmp_path / "products.txt"
+    products_file.write_text(
+        "# wishlist\n"
+        "https://www.amazon.com/dp/TEST123\n"
+        "\n"
+        "  https://www.amazon.com/dp/TEST456  \n"
+        "https://www.amazon.com/dp/TEST123\n"
+    )
+    
+    assert list(_iter_urls(str(products_file))) == [
+        "https://www.amazon.com/dp/TEST123",
+        "https://www.amazon.com/dp/TEST456"
+    ]
+
+
+@pytest.mark.skipif(not _DAEMON_SUPPORTED, reason="Unix sockets not available")
+def test_daemon_refuses_to_replace_regular_file(tmp_path):
+    socket_path = tmp_path / "results.csv"
+    socket_path.write_text("keep me")
+    
+    with pytest.raises(SystemExit):
+        _remove_stale_socket(str(socket_path))
+    
+    assert socket_path.read_text() == "keep me"